@@ -1,6 +1,6 @@
 import requests
 from flask import Flask, render_template, request, redirect, url_for, flash, Response, session
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment
 from urllib.parse import urljoin, urlparse
 import re
 import time
@@ -9,6 +9,30 @@ import aiohttp
 import json
 import threading
 import uuid
+import os
+import multiprocessing
+import argparse
+import hashlib
+import sqlite3
+from contextlib import closing, asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import lxml  # noqa: F401 - only probed to pick the fastest BeautifulSoup parser
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    import httpx  # Optional: only needed for the HTTP/2 transport
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - httpx's HTTP/2 support depends on it
+except ImportError:
+    h2 = None
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'
@@ -17,16 +41,511 @@ app.secret_key = 'your-secret-key-here'
 progress_data = {}
 progress_lock = threading.Lock()
 
+# Shared full-text search index, created on first use
+SEARCH_INDEX_PATH = os.environ.get(
+    'DOCS_EXPORTER_INDEX_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'docs_index.db')
+)
+search_index = None
+search_index_lock = threading.Lock()
+
+# Shared worker pool for HTML-to-markdown fallback conversion
+HTML_CONVERTER_WORKERS = 4
+html_converter_pool = None
+html_converter_pool_lock = threading.Lock()
+
+# Candidate selectors for the main content region, most specific first
+MAIN_CONTENT_SELECTORS = [
+    '#content-area',
+    'main article',
+    'article',
+    'main',
+    '[role="main"]',
+    '#content',
+    '.content',
+]
+
+# Elements that never carry documentation content; <header> is handled separately
+# because content regions often wrap the page title in one
+NON_CONTENT_TAGS = ['script', 'style', 'noscript', 'template', 'svg', 'iframe', 'select', 'textarea',
+                    'nav', 'footer', 'aside', 'button']
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Elements rendered inline; everything else is treated as a block
+INLINE_TAGS = {'a', 'abbr', 'b', 'br', 'code', 'em', 'i', 'img', 'kbd', 'mark', 'small',
+               's', 'span', 'strong', 'sub', 'sup', 'u'}
+
+class RateLimitedError(Exception):
+    """Raised when the server answers 429 Too Many Requests"""
+
+def get_html_converter_pool():
+    """Lazily create the process pool used for HTML-to-markdown conversion"""
+    global html_converter_pool
+    with html_converter_pool_lock:
+        if html_converter_pool is None:
+            # Export threads run inside a threaded Flask server, where forking can deadlock
+            html_converter_pool = ProcessPoolExecutor(max_workers=HTML_CONVERTER_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+        return html_converter_pool
+
+def warm_html_converter_pool():
+    """Start every converter worker up front so the first conversions don't pay process startup"""
+    pool = get_html_converter_pool()
+    list(pool.map(html_to_markdown, [''] * HTML_CONVERTER_WORKERS, [''] * HTML_CONVERTER_WORKERS))
+
+def reset_html_converter_pool(broken_pool):
+    """Discard a broken converter pool so the next call creates a fresh one"""
+    global html_converter_pool
+    with html_converter_pool_lock:
+        if html_converter_pool is broken_pool:
+            html_converter_pool = None
+    broken_pool.shutdown(wait=False)
+
+def _code_span(text):
+    """Wrap inline code in a backtick run longer than any it contains"""
+    longest = max((len(run) for run in re.findall(r'`+', text)), default=0)
+    fence = '`' * (longest + 1)
+    if text.startswith('`') or text.endswith('`'):
+        text = f" {text} "
+    return f"{fence}{text}{fence}"
+
+def _inline_markdown(nodes):
+    """Convert a sequence of inline nodes to a single markdown line"""
+    parts = []
+    for node in nodes:
+        if isinstance(node, Comment):
+            continue
+        if isinstance(node, str):
+            parts.append(re.sub(r'\s+', ' ', str(node)))
+            continue
+        name = node.name
+        if name == 'br':
+            parts.append('  \n')
+        elif name == 'code':
+            text = node.get_text()
+            if text:
+                parts.append(_code_span(text))
+        elif name in ('strong', 'b'):
+            text = _inline_markdown(node.children).strip()
+            if text:
+                parts.append(f"**{text}**")
+        elif name in ('em', 'i'):
+            text = _inline_markdown(node.children).strip()
+            if text:
+                parts.append(f"*{text}*")
+        elif name == 'a':
+            text = _inline_markdown(node.children).strip()
+            href = node.get('href', '')
+            if href and text and not href.startswith('#'):
+                parts.append(f"[{text}]({href})")
+            else:
+                parts.append(text)
+        elif name == 'img':
+            alt = node.get('alt', '').strip()
+            src = node.get('src', '')
+            if src and not src.startswith('data:'):
+                parts.append(f"![{alt}]({src})")
+            elif alt:
+                parts.append(f"[{alt}]")
+        else:
+            parts.append(_inline_markdown(node.children))
+    return ''.join(parts)
+
+def _is_inline(node):
+    """Whether a node belongs in the surrounding line of text"""
+    return isinstance(node, str) or node.name in INLINE_TAGS
+
+def _list_markdown(list_element, lines):
+    """Append markdown lines for a ul/ol element, indenting nested lists and block content under each item"""
+    ordered = list_element.name == 'ol'
+    for index, item in enumerate(list_element.find_all('li', recursive=False), 1):
+        marker = f"{index}." if ordered else '-'
+        continuation = ' ' * (len(marker) + 1)
+        item_lines = []
+        inline = []
+        
+        for child in list(item.children) + [None]:
+            if isinstance(child, Comment):
+                continue
+            if child is not None and _is_inline(child):
+                inline.append(child)
+                continue
+            text = _inline_markdown(inline).strip()
+            inline = []
+            if text:
+                item_lines.extend([text, ''])
+            if child is None:
+                break
+            if child.name in ('ul', 'ol'):
+                # Keep nested lists tight against the item text
+                if item_lines and not item_lines[-1]:
+                    item_lines.pop()
+                _list_markdown(child, item_lines)
+            else:
+                # Block content such as code samples or paragraphs stays inside the item
+                _node_markdown(child, item_lines)
+        
+        # Code blocks arrive as single multi-line entries; split so every line gets indented
+        item_lines = '\n'.join(item_lines).split('\n')
+        while item_lines and not item_lines[-1]:
+            item_lines.pop()
+        while item_lines and not item_lines[0]:
+            item_lines.pop(0)
+        if not item_lines:
+            lines.append(marker)
+            continue
+        lines.append(f"{marker} {item_lines[0]}")
+        lines.extend(continuation + line if line else '' for line in item_lines[1:])
+
+def _block_markdown(element, lines):
+    """Append markdown lines for the children of an element, joining runs of inline content"""
+    inline = []
+    for child in element.children:
+        if isinstance(child, Comment):
+            continue
+        if _is_inline(child):
+            inline.append(child)
+            continue
+        text = _inline_markdown(inline).strip()
+        if text:
+            lines.extend([text, ''])
+        inline = []
+        _node_markdown(child, lines)
+    text = _inline_markdown(inline).strip()
+    if text:
+        lines.extend([text, ''])
+
+def _node_markdown(node, lines):
+    """Append markdown lines for a single block-level element"""
+    name = node.name
+    if name in HEADING_TAGS:
+        text = _inline_markdown(node.children).strip()
+        if text:
+            lines.extend(['', f"{'#' * int(name[1])} {text}", ''])
+    elif name == 'p':
+        text = _inline_markdown(node.children).strip()
+        if text:
+            lines.extend([text, ''])
+    elif name == 'pre':
+        code = node.find('code')
+        language = ''
+        if code:
+            for css_class in code.get('class', []):
+                if css_class.startswith('language-'):
+                    language = css_class[len('language-'):]
+                    break
+        text = node.get_text().rstrip('\n')
+        longest = max((len(run) for run in re.findall(r'`{3,}', text)), default=2)
+        fence = '`' * (longest + 1)
+        lines.extend([f"{fence}{language}", text, fence, ''])
+    elif name in ('ul', 'ol'):
+        _list_markdown(node, lines)
+        lines.append('')
+    elif name == 'blockquote':
+        quoted = []
+        _block_markdown(node, quoted)
+        quoted = '\n'.join(quoted).split('\n')
+        while quoted and not quoted[-1]:
+            quoted.pop()
+        lines.extend(f"> {line}" if line else '>' for line in quoted)
+        lines.append('')
+    elif name == 'table':
+        table = [[_inline_markdown(cell.children).strip().replace('|', '\\|')
+                  for cell in row.find_all(['th', 'td'])] for row in node.find_all('tr')]
+        table = [row for row in table if row]
+        if table:
+            width = max(len(row) for row in table)
+            table = [row + [''] * (width - len(row)) for row in table]
+            lines.append('| ' + ' | '.join(table[0]) + ' |')
+            lines.append('|' + ' --- |' * width)
+            for row in table[1:]:
+                lines.append('| ' + ' | '.join(row) + ' |')
+            lines.append('')
+    elif name == 'hr':
+        lines.extend(['---', ''])
+    else:
+        _block_markdown(node, lines)
+
+def html_to_markdown(html, page_url):
+    """Extract the main content region of an HTML page and convert it to markdown"""
+    # Runs inside the converter process pool, so it only takes and returns plain data
+    soup = BeautifulSoup(html, HTML_PARSER)
+    
+    base = soup.find('base', href=True)
+    base_url = urljoin(page_url, base['href']) if base else page_url
+    
+    main = None
+    for selector in MAIN_CONTENT_SELECTORS:
+        main = soup.select_one(selector)
+        if main:
+            break
+    if main is None:
+        main = soup.body or soup
+    
+    for tag in main.find_all(NON_CONTENT_TAGS):
+        tag.decompose()
+    
+    # Keep headers that hold the page title, drop site chrome headers
+    for tag in main.find_all('header'):
+        if not tag.find(HEADING_TAGS):
+            tag.decompose()
+    
+    # Resolve relative links and images so they still work in the exported markdown
+    for link in main.find_all('a', href=True):
+        if not link['href'].startswith('#'):
+            link['href'] = urljoin(base_url, link['href'])
+    for image in main.find_all('img', src=True):
+        if not image['src'].startswith('data:'):
+            image['src'] = urljoin(base_url, image['src'])
+    
+    lines = []
+    _block_markdown(main, lines)
+    
+    markdown = '\n'.join(line.rstrip() for line in lines)
+    markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+    return markdown.strip()
+
+class SearchIndex:
+    """Local SQLite FTS5 full-text index over exported documentation pages"""
+    
+    def __init__(self, db_path=SEARCH_INDEX_PATH):
+        self.db_path = db_path
+        with closing(self._connect()) as conn, conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS pages (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT UNIQUE NOT NULL,
+                    site TEXT,
+                    group_name TEXT,
+                    title TEXT,
+                    content_hash TEXT NOT NULL,
+                    indexed_at REAL
+                )
+            ''')
+            conn.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+                    title, group_name, content, tokenize='porter unicode61'
+                )
+            ''')
+    
+    def _connect(self):
+        """Open a connection; WAL mode lets searches run while an export is indexing"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+    
+    def index_pages(self, pages):
+        """Index exported pages, only rewriting those whose title, group, site or content changed"""
+        with closing(self._connect()) as conn:
+            # Take the write lock before the first lookup so concurrent exports of the
+            # same URL serialize instead of racing on the UNIQUE(url) insert
+            conn.isolation_level = None
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                indexed = self._index_pages(conn, pages)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return indexed
+    
+    def _index_pages(self, conn, pages):
+        """Write changed pages inside the caller's transaction"""
+        indexed = 0
+        for page in pages:
+            site = page['site'].rstrip('/')
+            fingerprint = '\0'.join([site, page['group'], page['title'], page['content']])
+            content_hash = hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+            row = conn.execute('SELECT id, content_hash FROM pages WHERE url = ?', (page['url'],)).fetchone()
+            
+            if row and row[1] == content_hash:
+                continue  # Unchanged since last export
+            
+            if row:
+                page_id = row[0]
+                conn.execute(
+                    'UPDATE pages SET site = ?, group_name = ?, title = ?, content_hash = ?, indexed_at = ? WHERE id = ?',
+                    (site, page['group'], page['title'], content_hash, time.time(), page_id)
+                )
+                conn.execute('DELETE FROM pages_fts WHERE rowid = ?', (page_id,))
+            else:
+                page_id = conn.execute(
+                    'INSERT INTO pages (url, site, group_name, title, content_hash, indexed_at) VALUES (?, ?, ?, ?, ?, ?)',
+                    (page['url'], site, page['group'], page['title'], content_hash, time.time())
+                ).lastrowid
+            
+            conn.execute(
+                'INSERT INTO pages_fts (rowid, title, group_name, content) VALUES (?, ?, ?, ?)',
+                (page_id, page['title'], page['group'], page['content'])
+            )
+            indexed += 1
+        return indexed
+    
+    def search(self, query, limit=20, site=None):
+        """Return ranked page snippets matching all terms of the query"""
+        # Quote each term so user input can't trip FTS5 query syntax
+        terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+        if not terms:
+            return []
+        
+        sql = '''
+            SELECT pages.url, pages.title, pages.group_name, pages.site,
+                   snippet(pages_fts, 2, '**', '**', '...', 16),
+                   bm25(pages_fts, 10.0, 5.0, 1.0) AS score
+            FROM pages_fts JOIN pages ON pages.id = pages_fts.rowid
+            WHERE pages_fts MATCH ?
+        '''
+        params = [' '.join(terms)]
+        if site:
+            sql += ' AND pages.site = ?'
+            params.append(site.rstrip('/'))
+        sql += ' ORDER BY score LIMIT ?'
+        params.append(limit)
+        
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        
+        return [{
+            'url': url,
+            'title': title,
+            'group': group_name,
+            'site': site_url,
+            'snippet': snippet,
+            'score': score
+        } for url, title, group_name, site_url, snippet, score in rows]
+
+def get_search_index():
+    """Lazily open the shared search index; None if this SQLite build can't provide it (e.g. no FTS5)"""
+    global search_index
+    with search_index_lock:
+        if search_index is None:
+            try:
+                search_index = SearchIndex()
+            except sqlite3.Error:
+                return None
+        return search_index
+
+class AiohttpTransport:
+    """Default HTTP/1.1 transport: a pool of parallel keep-alive connections per host"""
+    name = 'aiohttp'
+    
+    def __init__(self, max_connections_per_host=15, verify_ssl=True):
+        self.max_connections_per_host = max_connections_per_host
+        self.verify_ssl = verify_ssl
+        self.session = None
+    
+    async def __aenter__(self):
+        # Optimized settings for speed
+        connector_options = dict(
+            limit=100,  # High connection pool
+            limit_per_host=self.max_connections_per_host,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            enable_cleanup_closed=True,
+            keepalive_timeout=30,
+        )
+        if not self.verify_ssl:
+            connector_options['ssl'] = False
+        connector = aiohttp.TCPConnector(**connector_options)
+        timeout = aiohttp.ClientTimeout(total=30, connect=5)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+    
+    def get(self, url, timeout=None):
+        """Async context manager yielding a response with status, text(), read() and raise_for_status()"""
+        # Passing timeout=None to aiohttp disables the session timeout, so only forward explicit values
+        if timeout is None:
+            return self.session.get(url)
+        return self.session.get(url, timeout=timeout)
+
+class Http2Response:
+    """Adapts an httpx streaming response to the aiohttp response interface used by the exporter"""
+    
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+    
+    async def read(self):
+        return await self._response.aread()
+    
+    async def text(self):
+        await self._response.aread()
+        return self._response.text
+    
+    def raise_for_status(self):
+        self._response.raise_for_status()
+
+class Http2Transport:
+    """HTTP/2 transport: one multiplexed connection per host carries all in-flight requests"""
+    name = 'http2'
+    
+    def __init__(self, max_connections_per_host=15, verify_ssl=True):
+        if httpx is None or h2 is None:
+            raise RuntimeError("HTTP/2 transport requires httpx with HTTP/2 support: pip install 'httpx[http2]'")
+        self.max_connections_per_host = max_connections_per_host
+        self.verify_ssl = verify_ssl
+        self.client = None
+    
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            http2=True,
+            # httpx only caps connections overall; HTTP/2 hosts use one each, so this
+            # bounds hosts that fall back to HTTP/1.1
+            limits=httpx.Limits(max_connections=self.max_connections_per_host, keepalive_expiry=30),
+            timeout=httpx.Timeout(30, connect=5),
+            verify=self.verify_ssl,
+            follow_redirects=True,  # Match aiohttp's default
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+    
+    @asynccontextmanager
+    async def get(self, url, timeout=None):
+        """Async context manager yielding a response with status, text(), read() and raise_for_status()"""
+        # Passing timeout=None to httpx disables every timeout, so fall back to the client's
+        if timeout is None:
+            timeout = httpx.USE_CLIENT_DEFAULT
+        try:
+            async with self.client.stream('GET', url, timeout=timeout) as response:
+                yield Http2Response(response)
+        except httpx.TimeoutException as e:
+            # The exporter's retry logic expects asyncio timeouts
+            raise asyncio.TimeoutError() from e
+
+TRANSPORTS = {
+    AiohttpTransport.name: AiohttpTransport,
+    Http2Transport.name: Http2Transport,
+}
+
+def available_transports():
+    """Names of transports whose dependencies are installed"""
+    return [name for name in TRANSPORTS if name != Http2Transport.name or (httpx and h2)]
+
 class DocsExporter:
-    def __init__(self, base_url, max_concurrent_requests=15, delay_between_requests=0.1):
+    def __init__(self, base_url, max_concurrent_requests=15, delay_between_requests=0.1, html_fallback=True,
+                 search_index=None, transport='aiohttp', verify_ssl=True):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport '{transport}', expected one of: {', '.join(TRANSPORTS)}")
         self.original_url = base_url.rstrip('/')
         self.base_url, self.domain, self.base_path = self._determine_optimal_base_url(base_url)
         self.max_concurrent_requests = max_concurrent_requests
         self.delay_between_requests = delay_between_requests
+        self.html_fallback = html_fallback  # Convert HTML pages when no .md version exists
+        self.search_index = search_index  # Optional SearchIndex updated after each export
+        self.transport = transport  # Name of the HTTP transport in TRANSPORTS
+        self.verify_ssl = verify_ssl
         self.semaphore = None  # Will be initialized in async context
         self.progress_callback = None  # For progress updates
         self.adaptive_delay = self.delay_between_requests  # Dynamic delay adjustment
         
+    def create_transport(self):
+        """Create the configured transport; it exposes the same get() interface as an aiohttp session"""
+        return TRANSPORTS[self.transport](self.max_concurrent_requests, verify_ssl=self.verify_ssl)
+    
     def set_progress_callback(self, callback):
         """Set callback function for progress updates"""
         self.progress_callback = callback
@@ -181,27 +700,33 @@ class DocsExporter:
                         md_url = url + '/.md'
                     
                     async with session.get(md_url, timeout=10) as response:
-                        if response.status == 404:
-                            return None, "Pages that don't exist"
-                        
-                        if response.status == 429:  # Rate limited
-                            # Increase adaptive delay for all future requests
-                            self.adaptive_delay = min(self.adaptive_delay * 2, 2.0)
-                            if attempt < max_retries - 1:
-                                wait_time = (2 ** attempt) * 1  # Faster backoff: 1, 2, 4 seconds
-                                await asyncio.sleep(wait_time)
-                                continue
-                            return None, "Rate limiting from the server"
-                        
-                        response.raise_for_status()
-                        content = await response.text()
-                        
-                        # Success - gradually reduce adaptive delay
-                        if self.adaptive_delay > self.delay_between_requests:
-                            self.adaptive_delay = max(self.adaptive_delay * 0.9, self.delay_between_requests)
-                        
-                        return content, None
+                        page_missing = response.status == 404
+                        if not page_missing:
+                            if response.status == 429:  # Rate limited
+                                raise RateLimitedError()
+                            
+                            response.raise_for_status()
+                            content = await response.text()
+                            
+                            # Success - gradually reduce adaptive delay
+                            if self.adaptive_delay > self.delay_between_requests:
+                                self.adaptive_delay = max(self.adaptive_delay * 0.9, self.delay_between_requests)
+                            
+                            return content, None
+                    
+                    # The .md response is released before the fallback asks for another connection
+                    if self.html_fallback:
+                        return await self.fetch_html_fallback_async(session, url)
+                    return None, "Pages that don't exist"
                         
+                except RateLimitedError:
+                    # Increase adaptive delay for all future requests
+                    self.adaptive_delay = min(self.adaptive_delay * 2, 2.0)
+                    if attempt < max_retries - 1:
+                        wait_time = (2 ** attempt) * 1  # Faster backoff: 1, 2, 4 seconds
+                        await asyncio.sleep(wait_time)
+                        continue
+                    return None, "Rate limiting from the server"
                 except asyncio.TimeoutError:
                     if attempt < max_retries - 1:
                         wait_time = 0.5 * (attempt + 1)  # Fast timeout retry: 0.5, 1, 1.5 seconds
@@ -216,6 +741,37 @@ class DocsExporter:
             
             return None, "Pages that can't be accessed after retries"
     
+    async def fetch_html_fallback_async(self, session, url):
+        """Fetch the HTML page and convert it to markdown when no .md version exists"""
+        # Rate limits and server errors propagate so the caller's retry loop handles them
+        async with session.get(url, timeout=10) as response:
+            if response.status == 404:
+                return None, "Pages that don't exist"
+            if response.status == 429:
+                raise RateLimitedError()
+            response.raise_for_status()
+            html = await response.read()
+        
+        # Same check as external pages, so soft-404s and JS-only app shells aren't exported
+        content = await self.convert_html_async(html, url)
+        if not content or not self.has_markdown_characteristics(content):
+            return None, "Pages that don't exist"
+        return content, None
+    
+    async def convert_html_async(self, html, page_url):
+        """Convert already-fetched HTML to markdown in the worker pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        pool = get_html_converter_pool()
+        try:
+            return await loop.run_in_executor(pool, html_to_markdown, html, page_url)
+        except BrokenProcessPool:
+            # A crashed worker breaks the whole pool; replace it and retry once, letting a second failure surface
+            reset_html_converter_pool(pool)
+            return await loop.run_in_executor(get_html_converter_pool(), html_to_markdown, html, page_url)
+        except Exception:
+            # HTML the parser couldn't convert
+            return None
+    
     def compress_content(self, content):
         """Compress content by removing verbose image markup and shortening URLs"""
         if not content or len(content.strip()) == 0:
@@ -297,13 +853,17 @@ class DocsExporter:
             await asyncio.sleep(self.delay_between_requests)
             
             # Fetch markdown version
+            md_content = None
             async with session.get(md_url, timeout=15) as md_response:
                 if md_response.status == 429:
                     await asyncio.sleep(2)
                     return False, "Rate limited"
-                if md_response.status != 200:
-                    return False, "No markdown version available"
-                md_content = await md_response.text()
+                if md_response.status == 200:
+                    md_content = await md_response.text()
+            
+            # Fall back only after the .md response has released its connection
+            if md_content is None:
+                return await self.validate_html_fallback(url, regular_content, "No markdown version available")
             
             # Check if there's a meaningful difference
             if len(md_content.strip()) == 0:
@@ -311,7 +871,7 @@ class DocsExporter:
                 
             # Simple check - markdown should be significantly different from HTML
             if abs(len(md_content) - len(regular_content)) < 100:
-                return False, "No markdown version found"
+                return await self.validate_html_fallback(url, regular_content, "No markdown version found")
             
             # Check if content has markdown characteristics
             if not self.has_markdown_characteristics(md_content):
@@ -324,6 +884,16 @@ class DocsExporter:
         except Exception as e:
             return False, f"Error validating external URL: {str(e)}"
     
+    async def validate_html_fallback(self, url, html, reason):
+        """Convert the HTML already fetched for validation, applying the same documentation checks"""
+        if not self.html_fallback:
+            return False, reason
+        
+        content = await self.convert_html_async(html, url)
+        if not content or not self.has_markdown_characteristics(content):
+            return False, reason
+        return True, content
+    
     def has_markdown_characteristics(self, content):
         """Check if content has typical markdown documentation characteristics"""
         if not content or len(content.strip()) < 100:
@@ -386,6 +956,7 @@ class DocsExporter:
         combined_content = []
         errors = []
         rejections = []  # Track external URL rejections separately
+        indexed_pages = []  # Page-level content for the search index
         
         # Initialize semaphore for rate limiting
         self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
@@ -395,19 +966,7 @@ class DocsExporter:
         if error:
             return None, [error], []
         
-        # Create session with optimized settings for speed
-        connector = aiohttp.TCPConnector(
-            limit=100,  # High connection pool
-            limit_per_host=self.max_concurrent_requests,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-            enable_cleanup_closed=True,
-            keepalive_timeout=30,
-        )
-        
-        timeout = aiohttp.ClientTimeout(total=30, connect=5)
-        
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        async with self.create_transport() as session:
             url_to_info = {}
             
             # Prepare URL info mapping
@@ -487,12 +1046,50 @@ class DocsExporter:
                             continue
                         
                         if content:
+                            indexed_pages.append({
+                                'url': page['url'],
+                                'site': self.base_url,
+                                'group': group['group'],
+                                'title': page['title'],
+                                'content': content
+                            })
                             if compress_links:
                                 content = self.compress_content(content)
                             combined_content.append(content)
         
+        # Update the search index off the event loop
+        if self.search_index and indexed_pages:
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, self.search_index.index_pages, indexed_pages)
+            except Exception as e:
+                errors.append(f"Search index update failed: {str(e)}")
+        
         return '\n'.join(combined_content), errors, rejections
 
+async def benchmark_transport_async(exporter, page_urls):
+    """Run the exporter's fetch path (.md lookup, HTML fallback, retries) over all pages and report timing"""
+    exporter.semaphore = asyncio.Semaphore(exporter.max_concurrent_requests)
+    exporter.adaptive_delay = exporter.delay_between_requests
+    
+    # Keep worker startup out of the timings, whichever transport runs first
+    if exporter.html_fallback:
+        warm_html_converter_pool()
+    
+    start = time.perf_counter()
+    async with exporter.create_transport() as session:
+        results = await asyncio.gather(*(exporter.fetch_markdown_content_async(session, url) for url in page_urls))
+    elapsed = time.perf_counter() - start
+    
+    ok = sum(1 for content, error in results if content)
+    return {
+        'transport': exporter.transport,
+        'requests': len(page_urls),
+        'ok': ok,
+        'failed': len(page_urls) - ok,
+        'elapsed': elapsed
+    }
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -555,13 +1152,17 @@ def scan():
         flash('No documentation pages found')
         return redirect(url_for('index'))
     
-    return render_template('select.html', nav_structure=nav_structure, base_url=url)
+    return render_template('select.html', nav_structure=nav_structure, base_url=url,
+                           transports=available_transports())
 
 @app.route('/export', methods=['POST'])
 def export():
     base_url = request.form.get('base_url')
     selected_urls = request.form.getlist('selected_pages')
     compress_links = 'compress_links' in request.form
+    transport = request.form.get('transport', 'aiohttp')
+    if transport not in available_transports():
+        transport = 'aiohttp'
     
     if not selected_urls:
         flash('Please select at least one page')
@@ -587,7 +1188,9 @@ def export():
         exporter = DocsExporter(
             base_url, 
             max_concurrent_requests=15,  # High concurrency
-            delay_between_requests=0.1   # Minimal delay
+            delay_between_requests=0.1,  # Minimal delay
+            search_index=get_search_index(),
+            transport=transport
         )
         
         # Set progress callback
@@ -641,6 +1244,31 @@ def export():
     # Redirect to progress page
     return redirect(url_for('exporting', progress_id=progress_id))
 
+@app.route('/search')
+def search():
+    """Full-text search over previously exported pages"""
+    query = request.args.get('q', '').strip()
+    site = request.args.get('site') or None
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), 100))
+    except ValueError:
+        limit = 20
+    
+    index = get_search_index()
+    if index is None:
+        return Response(json.dumps({'error': 'Search index unavailable (SQLite FTS5 required)'}),
+                        status=503, mimetype='application/json')
+    
+    start = time.perf_counter()
+    results = index.search(query, limit=limit, site=site) if query else []
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    return Response(json.dumps({
+        'query': query,
+        'results': results,
+        'elapsed_ms': round(elapsed_ms, 2)
+    }), mimetype='application/json')
+
 @app.route('/result/<progress_id>')
 def result(progress_id):
     """Show results after export completion"""
@@ -692,11 +1320,75 @@ Features:
 3. Adaptive delay adjustment
 4. High-speed concurrent processing
 5. Smart retry logic
+6. Full-text search over exported pages (SQLite FTS5)
 
 To run: python app.py
+To search exported pages: python app.py search <query> [--limit N] [--site URL]
+  (index stored next to app.py; override with DOCS_EXPORTER_INDEX_PATH)
+To compare transports: python app.py benchmark <base_url> [page ...] [--repeat N] [--transports aiohttp,http2] [--insecure] [--no-html-fallback]
+  (start a local h2 test server with: python bench_server.py, see its docstring)
         """)
         sys.exit(0)
     
+    if len(sys.argv) > 1 and sys.argv[1] == 'search':
+        parser = argparse.ArgumentParser(prog='python app.py search', description='Search exported pages')
+        parser.add_argument('query', nargs='+')
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--site', default=None)
+        args = parser.parse_args(sys.argv[2:])
+        if args.limit < 1:
+            parser.error('--limit must be at least 1')
+        
+        search_idx = get_search_index()
+        if search_idx is None:
+            print("Search index unavailable: this SQLite build has no FTS5 support")
+            sys.exit(1)
+        
+        start = time.perf_counter()
+        results = search_idx.search(' '.join(args.query), limit=args.limit, site=args.site)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        for hit in results:
+            print(f"{hit['group']} > {hit['title']}")
+            print(f"  {hit['url']}")
+            print(f"  {hit['snippet']}\n")
+        print(f"{len(results)} results in {elapsed_ms:.1f} ms")
+        sys.exit(0)
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'benchmark':
+        parser = argparse.ArgumentParser(prog='python app.py benchmark',
+                                         description='Compare transports on the exporter fetch path')
+        parser.add_argument('base_url', help='Docs base URL, e.g. https://localhost:8443/docs')
+        parser.add_argument('pages', nargs='*', help='Page URLs or paths relative to base_url (default: base_url)')
+        parser.add_argument('--repeat', type=int, default=1, help='Fetch the page list this many times')
+        parser.add_argument('--concurrency', type=int, default=15)
+        parser.add_argument('--transports', default=','.join(available_transports()))
+        parser.add_argument('--insecure', action='store_true', help='Skip TLS verification (self-signed test servers)')
+        parser.add_argument('--no-html-fallback', action='store_true',
+                            help='Skip HTML conversion so timings reflect only the transport')
+        args = parser.parse_args(sys.argv[2:])
+        if args.repeat < 1 or args.concurrency < 1:
+            parser.error('--repeat and --concurrency must be at least 1')
+        
+        transports = args.transports.split(',')
+        unknown = [name for name in transports if name not in available_transports()]
+        if unknown:
+            parser.error(f"unavailable transport(s): {', '.join(unknown)}. Available: {', '.join(available_transports())}")
+        
+        base_url = args.base_url.rstrip('/')
+        page_urls = [urljoin(base_url + '/', page) for page in args.pages] or [base_url]
+        page_urls *= args.repeat
+        
+        for transport_name in transports:
+            exporter = DocsExporter(base_url, max_concurrent_requests=args.concurrency,
+                                    transport=transport_name, verify_ssl=not args.insecure,
+                                    html_fallback=not args.no_html_fallback)
+            stats = asyncio.run(benchmark_transport_async(exporter, page_urls))
+            print(f"{stats['transport']:>8}: {stats['requests']} pages, {stats['ok']} ok, "
+                  f"{stats['failed']} failed in {stats['elapsed']:.2f}s "
+                  f"({stats['requests'] / stats['elapsed']:.1f} pages/s)")
+        sys.exit(0)
+    
     print("Starting High-Speed Docs Exporter...")
     print("- Target: 70 pages in under 20 seconds")
     print("- Max concurrent requests: 15")
@@ -0,0 +1,83 @@
+"""Local HTTP/2-capable docs server for benchmarking the exporter's transports.
+
+Serves /docs/page-N as HTML. Even pages also have a /docs/page-N/.md version;
+odd pages return 404 there, so the HTML fallback is exercised too.
+
+Requires hypercorn and a TLS certificate (browsers and httpx only negotiate
+HTTP/2 over TLS). To run a benchmark:
+
+    pip install hypercorn
+    openssl req -x509 -newkey rsa:2048 -nodes -days 7 -subj /CN=localhost \\
+        -keyout bench_key.pem -out bench_cert.pem
+    python bench_server.py --certfile bench_cert.pem --keyfile bench_key.pem
+    python app.py benchmark https://localhost:8443/docs page-1 page-2 page-3 page-4 --repeat 50 --insecure
+
+To compare the transports alone, skip HTML conversion and use only pages that
+have a .md version:
+
+    python app.py benchmark https://localhost:8443/docs page-2 page-4 --repeat 100 --insecure --no-html-fallback
+"""
+import argparse
+import asyncio
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+PAGE_PARAGRAPHS = 40
+
+def render_markdown(name):
+    """Markdown body for a page"""
+    sections = [f"# {name}\n"]
+    for i in range(PAGE_PARAGRAPHS):
+        sections.append(f"## Section {i}\n\nSome `inline code` and a [link](/docs/{name}).\n\n"
+                        f"```python\nprint({i})\n```\n")
+    return '\n'.join(sections)
+
+def render_html(name):
+    """HTML body for a page, wrapped in site chrome like a real docs site"""
+    sections = []
+    for i in range(PAGE_PARAGRAPHS):
+        sections.append(f"<h2>Section {i}</h2><p>Some <code>inline code</code> and a "
+                        f"<a href=\"/docs/{name}\">link</a>.</p><pre><code class=\"language-python\">print({i})\n</code></pre>")
+    return (f"<html><head><title>{name}</title></head><body><nav>Navigation</nav>"
+            f"<main><header><h1>{name}</h1></header>{''.join(sections)}</main>"
+            f"<footer>Footer</footer></body></html>")
+
+async def app(scope, receive, send):
+    """Minimal ASGI app serving docs pages and their .md versions"""
+    if scope['type'] != 'http':
+        return
+    
+    path = scope['path'].rstrip('/')
+    status, content_type, body = 404, 'text/plain', 'Not found'
+    if path.endswith('/.md'):
+        name = path[:-len('/.md')].rsplit('/', 1)[-1]
+        number = name.rsplit('-', 1)[-1]
+        if name.startswith('page-') and number.isdigit() and int(number) % 2 == 0:
+            status, content_type, body = 200, 'text/markdown', render_markdown(name)
+    elif path.startswith('/docs'):
+        name = path.rsplit('/', 1)[-1]
+        status, content_type, body = 200, 'text/html', render_html(name)
+    
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', f'{content_type}; charset=utf-8'.encode())],
+    })
+    await send({'type': 'http.response.body', 'body': body.encode('utf-8')})
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local HTTP/2 docs server for transport benchmarks')
+    parser.add_argument('--bind', default='localhost:8443')
+    parser.add_argument('--certfile', required=True)
+    parser.add_argument('--keyfile', required=True)
+    args = parser.parse_args()
+    
+    config = Config()
+    config.bind = [args.bind]
+    config.certfile = args.certfile
+    config.keyfile = args.keyfile
+    config.alpn_protocols = ['h2', 'http/1.1']
+    
+    print(f"Serving HTTP/2 docs on https://{args.bind}/docs")
+    asyncio.run(serve(app, config))